@@ -15,6 +15,10 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import contextlib
+import copy
+import dataclasses
+import pickle
 from dataclasses import dataclass
 
 import bs4
@@ -79,6 +83,10 @@ def test_by_score():
     b_actions = actions.by_raw_score("b")
     assert not b_actions
 
+    fused_actions = actions.filter(tag=wtl.actions.FillText, score="y", raw_score="y", raw_score_limit=2.0)
+    assert fused_actions == actions.by_type(wtl.actions.FillText).by_score("y").by_raw_score("y", limit=2.0)
+    assert len(fused_actions) == 1
+
 
 def test_by_selector():
     class MockSource:
@@ -113,6 +121,30 @@ def test_by_selector():
     divs = actions.by_selector(wtl.Selector("#yo"))
     assert not divs
 
+    actions.insert(0, wtl.actions.Click(actions[2].target))
+    divs = actions.by_selector(wtl.Selector("div"))
+    assert len(divs) == 3
+    assert divs[0] is actions[0]
+    assert actions.by_element(actions[0].target) == [actions[0], actions[3]]
+
+
+def test_by_selector_cache():
+    source = bs4.BeautifulSoup('<body wtl-uid="1"><div wtl-uid="2"></div></body>', "html5lib")
+
+    class MockPage:
+        page_source = source
+
+    actions = wtl.actions.Actions([wtl.actions.Click(wtl.PageElement(page=MockPage(), metadata={"wtl_uid": 2}))])
+    assert len(actions.by_selector(wtl.Selector("div"))) == 1
+
+    # Mutating the source is only picked up after a new snapshot has been created
+    div = source.find("div")
+    assert isinstance(div, bs4.Tag)
+    div["wtl-uid"] = "3"
+    assert len(actions.by_selector(wtl.Selector("div"))) == 1
+    wtl.PageSnapshot(page_source=source, page_metadata={}, elements_metadata=[])
+    assert not actions.by_selector(wtl.Selector("div"))
+
 
 def test_page_actions():
     navigate = wtl.actions.Navigate()
@@ -126,6 +158,22 @@ def test_page_actions():
     assert navigate_2.seconds == 3
 
 
+def test_slotted_actions():
+    action = wtl.actions.FillText(wtl.Selector("abc"), "text")
+    assert not hasattr(action, "__dict__")
+    assert copy.copy(action) == action
+    assert copy.deepcopy(action) == action
+    assert pickle.loads(pickle.dumps(action)) == action
+    assert dataclasses.replace(action, text="other") == wtl.actions.FillText(wtl.Selector("abc"), "other")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        action.text = "other"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        action.foo = 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del action.text
+
+
 def test_transformed_to_element():
     @dataclass
     class Temp:
@@ -144,3 +192,45 @@ def test_transformed_to_element():
 
     with pytest.raises(AssertionError):
         element_action = element_action.transformed_to_element(MockElements(0))
+
+
+def test_execute_batch():
+    class MockWorkflow:
+        def __init__(self):
+            self.calls = []
+
+        @property
+        def js(self):
+            return self
+
+        def frame(self, iframe):
+            self.calls.append(("frame", iframe))
+            return contextlib.nullcontext()
+
+        def batch_dom_ops(self, ops):
+            self.calls.append(("batch", [op["type"] for op in ops]))
+
+    class MockWait(wtl.actions.PageAction):
+        def execute(self, workflow):
+            workflow.calls.append(("wait", None))
+
+    workflow = MockWorkflow()
+    wtl.actions.Actions(
+        [
+            wtl.actions.Click(wtl.Selector("a")),
+            wtl.actions.FillText(wtl.Selector("b"), "text"),
+            MockWait(),
+            wtl.actions.Click(wtl.Selector("c")),
+            wtl.actions.Click(wtl.Selector("d", iframe="/iframe")),
+        ]
+    ).execute_batch(workflow)
+
+    assert workflow.calls == [
+        ("frame", None),
+        ("batch", ["click", "fill"]),
+        ("wait", None),
+        ("frame", None),
+        ("batch", ["click"]),
+        ("frame", "/iframe"),
+        ("batch", ["click"]),
+    ]
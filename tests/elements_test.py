@@ -91,3 +91,18 @@ def test_by_selector():
 
     with pytest.raises(AssertionError):
         elements.by_subtree(wtl.Selector("does-not-exist"))
+
+
+def test_by_selector_cache():
+    class MockPage:
+        page_source = bs4.BeautifulSoup('<body wtl-uid="0"><a wtl-uid="1"></a><a wtl-uid="2"></a></body>', "html5lib")
+
+    elements = wtl.snapshot.Elements([wtl.PageElement(page=MockPage(), metadata={"wtl_uid": 1})])
+
+    links = elements.by_selector(wtl.Selector("a"))
+    assert len(links) == 1
+    links.append(None)
+    assert len(elements.by_selector(wtl.Selector("a"))) == 1
+
+    elements.append(wtl.PageElement(page=MockPage(), metadata={"wtl_uid": 2}))
+    assert len(elements.by_selector(wtl.Selector("a"))) == 2
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import bs4
 import pytest
 
 import webtraversallibrary as wtl
@@ -41,18 +42,6 @@ class MockWebDriver:
         self.f = "default"
 
 
-class MockSnapshot:
-    def __init__(self, elements):
-        self._elements = elements
-
-    @property
-    def elements(self):
-        return self
-
-    def by_selector(self, s):
-        return self._elements[s.css]
-
-
 def test_classifier_collection():
     collection = ClassifierCollection(
         [
@@ -89,6 +78,45 @@ def test_classifier_collection():
     assert len([c for c in collection if c.enabled]) == 3
 
 
+def test_classifier_collection_active():
+    collection = ClassifierCollection(
+        [
+            wtl.classifiers.ElementClassifier(name="aaa", callback=len),
+            wtl.classifiers.ElementClassifier(name="bbb", callback=len, enabled=False),
+            wtl.classifiers.ViewClassifier(name="ccc", callback=len),
+        ]
+    )
+
+    active = collection.active_element_classifiers
+    assert "aaa" in active and len(active) == 1
+    assert collection.active_element_classifiers is active
+    assert len(collection.active_view_classifiers) == 1
+
+    collection.start("bbb")
+    assert len(collection.active_element_classifiers) == 2
+
+    collection.add(wtl.classifiers.ViewClassifier(name="ddd", callback=len))
+    assert len(collection.active_view_classifiers) == 2
+
+
+def test_classifier_collection_direct_mutation():
+    classifier = wtl.classifiers.ElementClassifier(name="aaa", callback=len)
+    view_classifier = wtl.classifiers.ViewClassifier(name="bbb", callback=None)
+    collection = ClassifierCollection([classifier, view_classifier])
+    assert len(collection.active_element_classifiers) == 1
+    assert len(collection.active_view_classifiers) == 0
+
+    classifier.enabled = False
+    assert len(collection.active_element_classifiers) == 0
+
+    classifier.enabled = True
+    classifier.callback = None
+    assert len(collection.active_element_classifiers) == 0
+
+    view_classifier.callback = len
+    assert len(collection.active_view_classifiers) == 1
+
+
 def test_monkeypatches():
     patches = MonkeyPatches({wtl.Selector("aaa"): "AAA"})
 
@@ -100,12 +128,16 @@ def test_monkeypatches():
     assert wtl.Selector("aaa") in patches
     assert wtl.Selector("bbb") in patches
 
-    e1 = wtl.snapshot.PageElement(None, {"x": 1})
-    e2 = wtl.snapshot.PageElement(None, {"x": 2})
-    e3 = wtl.snapshot.PageElement(None, {"x": 3})
-    e4 = wtl.snapshot.PageElement(None, {"x": 4})
-
-    snapshot = MockSnapshot({"aaa": [e1, e3], "bbb": [e2]})
+    snapshot = wtl.PageSnapshot(
+        page_source=bs4.BeautifulSoup(
+            '<body wtl-uid="0"><aaa wtl-uid="1"></aaa><bbb wtl-uid="2"></bbb>'
+            '<aaa wtl-uid="3"></aaa><p wtl-uid="4"></p></body>',
+            "html5lib",
+        ),
+        page_metadata={},
+        elements_metadata=[{"wtl_uid": i} for i in range(5)],
+    )
+    _, e1, e2, e3, e4 = snapshot.elements
 
     assert patches.check(snapshot, e1) == "AAA"
     assert patches.check(snapshot, e2) == "BBB"
@@ -117,6 +149,39 @@ def test_monkeypatches():
     assert patches.check(snapshot, e4) == "CCC"
     assert patches.check(snapshot, e1) == "AAA"
 
+    patches.add(wtl.Selector("aaa:first-of-type, bbb, p"), "DDD")
+
+    assert patches.check(snapshot, e1) == "DDD"
+    assert patches.check(snapshot, e3) == "AAA"
+    assert patches.check(snapshot, e4) == "DDD"
+
+    # :scope refers to the document root, as when querying each selector separately
+    patches = MonkeyPatches({wtl.Selector(":scope > body"): "BODY", wtl.Selector(":scope aaa"): "AAA"})
+    body, e1, _, _, e4 = snapshot.elements
+
+    assert patches.check(snapshot, body) == "BODY"
+    assert patches.check(snapshot, e1) == "AAA"
+    assert not patches.check(snapshot, e4)
+
+
+def test_monkeypatches_successive_snapshots():
+    patches = MonkeyPatches({wtl.Selector("a"): "AAA"})
+
+    def snapshot(tag):
+        return wtl.PageSnapshot(
+            page_source=bs4.BeautifulSoup(f'<body wtl-uid="0"><{tag} wtl-uid="1"></{tag}></body>', "html5lib"),
+            page_metadata={},
+            elements_metadata=[{"wtl_uid": 0}, {"wtl_uid": 1}],
+        )
+
+    # Snapshots are freed after each check, so their ids may be reused, without clear_cache() in between
+    for i in range(50):
+        tag = "a" if i % 2 == 0 else "b"
+        s = snapshot(tag)
+        assert patches.check(s, s.elements[1]) == ("AAA" if tag == "a" else None)
+
+    assert len(patches._cache) <= MonkeyPatches.MAX_CACHED_SNAPSHOTS  # pylint: disable=protected-access
+
 
 def test_frame_switcher():
     js = MockJavascriptWrapper()
@@ -131,3 +196,26 @@ def test_frame_switcher():
 
     with pytest.raises(wtl.ElementNotFoundError):
         FrameSwitcher("FAIL", js, driver)
+
+
+def test_frame_switcher_cache():
+    class MockFindingWebDriver(MockWebDriver):
+        def __init__(self):
+            super().__init__()
+            self.found = 0
+
+        def find_element(self, _, xpath):
+            self.found += 1
+            return xpath + "iframe"
+
+    driver = MockFindingWebDriver()
+    cache = {}
+
+    with FrameSwitcher("abc", None, driver, cache=cache):
+        assert driver.f == "abciframe"
+    with FrameSwitcher("abc", None, driver, cache=cache):
+        assert driver.f == "abciframe"
+
+    assert driver.found == 1
+    assert driver.f == "default"
+    assert cache == {"abc": "abciframe"}
@@ -15,6 +15,10 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from types import SimpleNamespace
+
+from selenium.common.exceptions import TimeoutException
+
 import webtraversallibrary as wtl
 from webtraversallibrary.javascript import JavascriptWrapper
 
@@ -91,3 +95,34 @@ def test_javascript_wrapper():
     result = js.find_viewport()
     assert result.bounds == (1, 2, 4, 6)
     assert driver.calls == 20
+
+
+def test_select_framework_option():
+    driver = MockWebDriver()
+    js = JavascriptWrapper(driver)
+
+    driver.to_return = "selected"
+    assert js.select_framework_option("li", "value") == "selected"
+    assert driver.calls == 1
+
+
+def test_wait_for_element():
+    class MockAsyncWebDriver(MockWebDriver):
+        def __init__(self, timeouts=None):
+            super().__init__()
+            self.timeouts = timeouts
+            self.args = None
+
+        def execute_async_script(self, _, *args):
+            self.args = args
+            raise TimeoutException()
+
+    driver = MockAsyncWebDriver()
+    js = JavascriptWrapper(driver)
+    assert js.wait_for_element(wtl.Selector("abc"), interval=0.5) is False
+    assert driver.args == ("abc", 500, 20000)
+
+    driver = MockAsyncWebDriver(timeouts=SimpleNamespace(script=10))
+    js = JavascriptWrapper(driver)
+    assert js.wait_for_element(wtl.Selector("abc")) is False
+    assert driver.args == ("abc", 1000, 8000)
@@ -25,23 +25,122 @@ the missing attributes to replace those.
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
+import weakref
 from abc import ABC
-from dataclasses import dataclass, replace
+from dataclasses import FrozenInstanceError, dataclass, replace
 from time import sleep
-from typing import Union
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple, Union
 from random import randint
 
+import bs4
+
 from .color import Color
 from .geometry import Point
+from .processtools import InvalidatingList
 from .selector import Selector
-from .snapshot import Elements, PageElement
+from .snapshot import Elements, PageElement, snapshot_callbacks
 from selenium.webdriver.support.ui import Select as WebDriverSelect
 from selenium.webdriver.common.by import By
 
 logger = logging.getLogger("wtl")
 
+# Maps id() of a page source to a weak reference of it, guarding the selector cache against reused ids
+_page_sources: Dict[int, weakref.ref] = {}
+
+
+@functools.lru_cache(maxsize=1024)
+def _select_tags_by_id(page_source_id: int, css: str) -> Tuple[Tuple[bs4.Tag, ...], FrozenSet[int]]:
+    """Returns all tags matching the CSS selector in the page source with given id, and their wtl-uids."""
+    tags = tuple(_page_sources[page_source_id]().select(css))
+    return tags, frozenset(int(x.attrs["wtl-uid"]) for x in tags if "wtl-uid" in x.attrs)
+
+
+def _clear_select_tags():
+    _select_tags_by_id.cache_clear()
+    _page_sources.clear()
+
+
+def _select_tags(page_source: bs4.Tag, css: str) -> Tuple[Tuple[bs4.Tag, ...], FrozenSet[int]]:
+    """
+    Cached equivalent of ``page_source.select(css)``, also returning the wtl-uids of all matched tags.
+    The cache is cleared whenever a new :class:`PageSnapshot` is created.
+    """
+    key = id(page_source)
+    ref = _page_sources.get(key)
+    if ref is None or ref() is not page_source:
+        if ref is not None:
+            # The id has been reused by a new object, all results for the old one are invalid
+            _select_tags_by_id.cache_clear()
+        _page_sources[key] = weakref.ref(page_source)
+    return _select_tags_by_id(key, css)
+
+
+snapshot_callbacks.append(_clear_select_tags)
+
+_NO_RAW_SCORES: Dict[str, float] = {}
+
+
+def _slotted(cls: type) -> type:
+    """
+    Recreates a frozen dataclass with ``__slots__`` for its own fields, equivalent to
+    ``dataclass(frozen=True, slots=True)`` which requires Python 3.10. Instances have no ``__dict__``.
+    """
+    inherited = {name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())}
+    own_fields = [f for f in dataclasses.fields(cls) if f.name not in inherited]
+
+    namespace = dict(cls.__dict__)
+    for f in own_fields:
+        # Defaults are kept by the generated __init__, the class attributes would conflict with the slots
+        namespace.pop(f.name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = tuple(f.name for f in own_fields)
+    namespace["__getstate__"] = _slotted_getstate
+    namespace["__setstate__"] = _slotted_setstate
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+
+    # The dataclass generated __setattr__ and __delattr__ refer to the original class, replace them
+    setattr(new_cls, "__setattr__", _frozen_setattr(new_cls))
+    setattr(new_cls, "__delattr__", _frozen_delattr(new_cls))
+    return new_cls
+
+
+def _frozen_setattr(cls: type):
+    def __setattr__(self, name, value):
+        # Exact type check, mirroring the __setattr__ and __delattr__ generated by dataclasses
+        # pylint: disable=unidiomatic-typecheck
+        if type(self) is cls or name in cls.__dataclass_fields__:  # type: ignore
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        super(cls, self).__setattr__(name, value)
+
+    return __setattr__
+
+
+def _frozen_delattr(cls: type):
+    def __delattr__(self, name):
+        # Exact type check, mirroring the __setattr__ and __delattr__ generated by dataclasses
+        # pylint: disable=unidiomatic-typecheck
+        if type(self) is cls or name in cls.__dataclass_fields__:  # type: ignore
+            raise FrozenInstanceError(f"cannot delete field {name!r}")
+        super(cls, self).__delattr__(name)
+
+    return __delattr__
+
+
+def _slotted_getstate(self):
+    return [getattr(self, f.name) for f in dataclasses.fields(self)]
+
 
+def _slotted_setstate(self, state):
+    # Frozen instances can only be restored through object.__setattr__
+    for f, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+@_slotted
 @dataclass(frozen=True)
 class Action(ABC):
     """
@@ -54,6 +153,13 @@ class Action(ABC):
     def execute(self, workflow):
         pass
 
+    def to_dom_op(self) -> Dict[str, Any]:  # pylint: disable=no-self-use
+        """
+        Returns this action as an operation for :func:`JavascriptWrapper.batch_dom_ops`,
+        or None if it cannot be batched.
+        """
+        return None
+
     def __call__(self, *args, **kwargs):
         if not args:
             return replace(self, **kwargs)
@@ -65,42 +171,94 @@ class Action(ABC):
         return replace(self, **{fields[0]: args[0]})
 
 
-class Actions(list):
+class Actions(InvalidatingList):
     """Helper class for a list of actions"""
 
+    # Maps wtl_uid to all (position, action) pairs acting on that element, reset when the list is mutated
+    __slots__ = ("_uid_index",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._uid_index: Dict[int, List[Tuple[int, ElementAction]]] = None
+
+    def _invalidate(self):
+        self._uid_index = None
+
+    def _by_uids(self, wtl_uids: Iterable[int]) -> Actions:
+        """Returns all actions (ElementAction) acting upon an element with one of the given wtl_uids, in order."""
+        index: Dict[int, List[Tuple[int, ElementAction]]] = getattr(self, "_uid_index", None)
+        if index is None:
+            index = self._uid_index = {}
+            for position, action in enumerate(self):
+                if isinstance(action, ElementAction) and isinstance(action.target, PageElement):
+                    if "wtl_uid" in action.target.metadata:
+                        index.setdefault(action.target.metadata["wtl_uid"], []).append((position, action))
+
+        matches = [entry for wtl_uid in wtl_uids for entry in index.get(wtl_uid, ())]
+        matches.sort(key=lambda entry: entry[0])
+        return Actions([action for _, action in matches])
+
+    def filter(
+        self,
+        tag: type = None,
+        score: str = None,
+        score_limit: float = 0.0,
+        raw_score: str = None,
+        raw_score_limit: float = 0.0,
+    ) -> Actions:
+        """
+        Returns all actions matching every given criteria.
+        Equivalent to chaining :func:`by_type`, :func:`by_score`, and :func:`by_raw_score`.
+        """
+        if score is None and raw_score is None:
+            return self.by_type(tag) if tag is not None else Actions(self)
+
+        # One comprehension per criterion is faster than checking every criterion for each action in a loop
+        element_tag: type = ElementAction
+        if tag is not None and issubclass(tag, ElementAction):
+            element_tag = tag
+        if score is not None:
+            actions = [
+                action
+                for action in self
+                if isinstance(action, element_tag)
+                and score in action.target.metadata  # type: ignore
+                and action.target.metadata[score] > score_limit  # type: ignore
+            ]
+        else:
+            actions = [action for action in self if isinstance(action, element_tag)]
+        if tag is not None and element_tag is not tag:
+            actions = [action for action in actions if isinstance(action, tag)]
+        if raw_score is not None:
+            actions = [
+                action
+                for action in actions
+                # Bypasses the PageElement.raw_scores property, which inserts missing dicts
+                if raw_score in action.target.metadata.get("raw_scores", _NO_RAW_SCORES)  # type: ignore
+                and action.target.metadata["raw_scores"][raw_score] > raw_score_limit  # type: ignore
+            ]
+        return Actions(actions)
+
     def by_type(self, tag: type) -> Actions:
         """Returns all actions of the given type."""
         return Actions([action for action in self if isinstance(action, tag)])
 
     def by_score(self, name: str, limit: float = 0.0) -> Actions:
         """Returns all actions with the given score (metadata entry) greater than the given limit."""
-        return Actions(
-            [
-                action
-                for action in self
-                if isinstance(action, ElementAction)
-                and name in action.target.metadata  # type: ignore
-                and action.target.metadata[name] > limit  # type: ignore
-            ]
-        )
+        return self.filter(score=name, score_limit=limit)
 
     def by_raw_score(self, name: str, limit: float = 0.0) -> Actions:
         """
         Returns all actions with the given raw score (output from a classifier before scaling)
         greater than the given limit.
         """
-        return Actions(
-            [
-                action
-                for action in self
-                if isinstance(action, ElementAction)
-                and name in action.target.raw_scores  # type: ignore
-                and action.target.raw_scores[name] > limit  # type: ignore
-            ]
-        )
+        return self.filter(raw_score=name, raw_score_limit=limit)
 
     def by_element(self, element: PageElement) -> Actions:
         """Returns all actions (ElementAction) that act upon the given element."""
+        if isinstance(element, PageElement) and "wtl_uid" in element.metadata:
+            candidates = self._by_uids([element.metadata["wtl_uid"]])
+            return Actions([action for action in candidates if action.target == element])
         return Actions([action for action in self if isinstance(action, ElementAction) and action.target == element])
 
     def by_selector(self, selector: Selector) -> Actions:
@@ -111,20 +269,26 @@ class Actions(list):
         if not self:
             return Actions([])
 
-        element_actions = self.by_type(ElementAction)
-        if not element_actions:
+        first = next((action for action in self if isinstance(action, ElementAction)), None)
+        if first is None:
             return Actions([])
 
-        tags = set(element_actions[0].target.page.page_source.html.select(selector.css))
+        tags, wtl_uids = _select_tags(first.target.page.page_source.html, selector.css)  # type: ignore
         if not tags:
             return Actions([])
 
-        wtl_uids = set(int(x.attrs["wtl-uid"]) for x in tags if "wtl-uid" in x.attrs)
-        actions = Actions([action for action in element_actions if action.target.wtl_uid in wtl_uids])
+        actions = self._by_uids(wtl_uids)
 
         # Falls back on BS4 tags if selector matches something that hasn't been snapshotted yet
         if not actions:
-            actions = Actions([action for action in element_actions if action.target.tag in tags])
+            tag_set = set(tags)
+            actions = Actions(
+                [
+                    action
+                    for action in self
+                    if isinstance(action, ElementAction) and action.target.tag in tag_set  # type: ignore
+                ]
+            )
 
         return actions
 
@@ -135,12 +299,42 @@ class Actions(list):
         self.sort(key=lambda action: action.target.raw_scores.get(name, 0), reverse=reverse)
         return self
 
+    def execute_batch(self, workflow):
+        """
+        Executes all actions in order. Consecutive actions supporting :func:`Action.to_dom_op` (clicks and
+        text fills) in the same iframe are performed in a single script call.
+
+        .. note::
+            Unlike the workflow loop, this applies no monkeypatches or debug output.
+            Only batch actions that do not change the page for each other.
+        """
+        ops: List[Dict[str, Any]] = []
+        ops_iframe: str = None
+
+        for action in self:
+            op = action.to_dom_op()
+            if ops and (op is None or action.selector.iframe != ops_iframe):
+                with workflow.frame(ops_iframe):
+                    workflow.js.batch_dom_ops(ops)
+                ops = []
+
+            if op is None:
+                action.execute(workflow)
+            else:
+                ops_iframe = action.selector.iframe
+                ops.append(op)
+
+        if ops:
+            with workflow.frame(ops_iframe):
+                workflow.js.batch_dom_ops(ops)
+
     def unique(self) -> Action:
         """Checks if exactly one element exists, if so returns it. Throws AssertionError otherwise"""
         assert len(self) == 1
         return self[0]
 
 
+@_slotted
 @dataclass(frozen=True)
 class ElementAction(Action):
     """
@@ -165,6 +359,7 @@ class ElementAction(Action):
         return self.target if isinstance(self.target, Selector) else self.target.selector
 
 
+@_slotted
 @dataclass(frozen=True)
 class PageAction(Action):
     """
@@ -172,6 +367,7 @@ class PageAction(Action):
     """
 
 
+@_slotted
 @dataclass(frozen=True)
 class Click(ElementAction):
     """
@@ -183,7 +379,12 @@ class Click(ElementAction):
         with workflow.frame(self.selector.iframe):
             workflow.js.click_element(self.selector, self.target.wtl_uid)
 
+    def to_dom_op(self) -> Dict[str, Any]:
+        wtl_uid = self.target.wtl_uid if isinstance(self.target, PageElement) else None
+        return {"type": "click", "css": self.selector.css, "wtlUid": wtl_uid}
+
 
+@_slotted
 @dataclass(frozen=True)
 class FillText(ElementAction):
     """
@@ -197,7 +398,11 @@ class FillText(ElementAction):
         with workflow.frame(self.selector.iframe):
             workflow.js.fill_text(self.selector, self.text)
 
+    def to_dom_op(self) -> Dict[str, Any]:
+        return {"type": "fill", "css": self.selector.css, "text": self.text}
+
 
+@_slotted
 @dataclass(frozen=True)
 class Select(ElementAction):
     """
@@ -224,6 +429,7 @@ class Select(ElementAction):
                 pass
 
 
+@_slotted
 @dataclass(frozen=True)
 class SelectFramework(ElementAction):
     """
@@ -246,24 +452,10 @@ class SelectFramework(ElementAction):
         with workflow.frame(self.selector.iframe):
             workflow.js.click_element(self.selector)
             sleep(1) # Give the options a chance to load in case they are asynchronous
-            optionEls = workflow.driver.find_elements(By.TAG_NAME, self.optionTag)
-            targetEl = None
-            for optionEl in optionEls:
-                if self.value.lower() in optionEl.text.lower():
-                    """
-                    In the event of multiple matches, select the shortest option text.
-                    """
-                    if not targetEl:
-                        targetEl = optionEl
-                    elif len(optionEl.text) < len(targetEl.text):
-                        targetEl = optionEl
-
-            if targetEl:
-                # TODO: We should set the "selected" attribute to search for when creating the action
-                # since aria-selected may not always be the attribute that is used
-                selectedValue = targetEl.get_attribute("aria-selected")
-                if selectedValue != "true":
-                    targetEl.click()
+            # Matching and clicking is done in the browser to avoid one round-trip per option
+            status = workflow.js.select_framework_option(self.optionTag, self.value)
+            if status == "not_found":
+                logger.warning(f"Found no <{self.optionTag}> option matching '{self.value}'")
 
             """
             Click somewhere else on the page to ensure the dropdown gets closed;
@@ -275,6 +467,7 @@ class SelectFramework(ElementAction):
             dummyEl.click()
 
 
+@_slotted
 @dataclass(frozen=True)
 class ScrollTo(ElementAction):
     """
@@ -285,6 +478,7 @@ class ScrollTo(ElementAction):
         workflow.smart_scroll_to(self.target.bounds)
 
 
+@_slotted
 @dataclass(frozen=True)
 class Highlight(ElementAction):
     """
@@ -301,6 +495,7 @@ class Highlight(ElementAction):
         workflow.js.highlight(selector=self.selector, color=self.color, fill=self.fill, viewport=viewport)
 
 
+@_slotted
 @dataclass(frozen=True)
 class Remove(ElementAction):
     """Removes the given element from the DOM."""
@@ -308,6 +503,7 @@ class Remove(ElementAction):
     def execute(self, workflow):
         workflow.js.delete_element(self.selector)
 
+@_slotted
 @dataclass(frozen=True)
 class AddIframe(ElementAction):
     name: str = None
@@ -327,6 +523,7 @@ class AddIframe(ElementAction):
             logger.warning(f"Error creating iframe: {self.name}")
             logger.error(e)
 
+@_slotted
 @dataclass(frozen=True)
 class Annotate(PageAction):
     """
@@ -354,6 +551,7 @@ class Annotate(PageAction):
         )
 
 
+@_slotted
 @dataclass(frozen=True)
 class Clear(PageAction):
     """
@@ -368,6 +566,7 @@ class Clear(PageAction):
         workflow.js.clear_highlights(viewport=viewport)
 
 
+@_slotted
 @dataclass(frozen=True)
 class Navigate(PageAction):
     """
@@ -378,9 +577,11 @@ class Navigate(PageAction):
     url: str = ""
 
     def execute(self, workflow):
+        workflow.clear_iframe_cache()
         workflow.scraper.navigate(self.url)
 
 
+@_slotted
 @dataclass(frozen=True)
 class Revert(PageAction):
     """
@@ -393,9 +594,11 @@ class Revert(PageAction):
     view_index: int = 0
 
     def execute(self, workflow):
+        workflow.clear_iframe_cache()
         workflow.reset_to(self.view_index)
 
 
+@_slotted
 @dataclass(frozen=True)
 class Wait(PageAction):
     """
@@ -408,21 +611,24 @@ class Wait(PageAction):
         sleep(self.seconds)
 
 
+@_slotted
 @dataclass(frozen=True)
 class WaitForElement(PageAction):
     """
     Checks to see if element at given selector exists on the page.
     Keeps trying indefinitely with a given interval until it succeeds.
+    The waiting is done in the browser, which also reacts to DOM changes between the intervals.
     """
 
     selector: Selector
     seconds: float = 1.0
 
     def execute(self, workflow):
-        while not workflow.js.element_exists(self.selector):
+        while not workflow.js.wait_for_element(self.selector, interval=self.seconds):
             sleep(self.seconds)
 
 
+@_slotted
 @dataclass(frozen=True)
 class WaitForUser(PageAction):
     """
@@ -433,6 +639,7 @@ class WaitForUser(PageAction):
         _ = input("Click [Enter] to continue...")
 
 
+@_slotted
 @dataclass(frozen=True)
 class Refresh(PageAction):
     """
@@ -442,9 +649,11 @@ class Refresh(PageAction):
     """
 
     def execute(self, workflow):
+        workflow.clear_iframe_cache()
         workflow.scraper.refresh()
 
 
+@_slotted
 @dataclass(frozen=True)
 class Abort(PageAction):
     """
@@ -27,10 +27,14 @@ Collection of helper classes used in Workflow.
 
 import logging
 from collections.abc import Collection
-from typing import Any, Dict, Iterable, Union
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple, Union
 
+import soupsieve
 from selenium import webdriver
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 
 from .classifiers import Classifier, ElementClassifier, ViewClassifier
 from .error import ElementNotFoundError
@@ -42,32 +46,62 @@ logger = logging.getLogger("wtl")
 
 
 class ClassifierCollection(Collection):
-    """Helper class for predefined classifiers"""
+    """
+    Helper class for predefined classifiers.
+    Enable and disable classifiers with :func:`start` and :func:`stop`, the active subsets are cached
+    and rebuilt whenever a classifier is added or its ``enabled`` or ``callback`` changes.
+    """
 
     def __init__(self, classifiers: Iterable[Classifier]):
         self._classifiers: Dict[str, Classifier] = {}
+        self._version = 0
+        self._active_elem_cache: Tuple[Tuple, ClassifierCollection] = None
+        self._active_view_cache: Tuple[Tuple, ClassifierCollection] = None
         if classifiers:
             for classifier in classifiers:
                 self.add(classifier)
 
     def add(self, classifier: Classifier):
         self._classifiers[classifier.name] = classifier
+        self._version += 1
 
     def start(self, classifier: Union[str, Classifier]):
+        """Enables the classifier with given name."""
         name = classifier if isinstance(classifier, str) else classifier.name
         self._classifiers[name].enabled = True
+        self._version += 1
 
     def stop(self, classifier: Union[str, Classifier]):
+        """Disables the classifier with given name."""
         name = classifier if isinstance(classifier, str) else classifier.name
         self._classifiers[name].enabled = False
+        self._version += 1
+
+    def _cache_key(self) -> Tuple:
+        # Classifiers can also be changed directly, not only through start and stop
+        return (self._version, tuple((c.enabled, c.callback is not None) for c in self))
 
     @property
     def active_element_classifiers(self):
-        return ClassifierCollection([c for c in self if c.enabled and c.callback and isinstance(c, ElementClassifier)])
+        """All enabled element classifiers that have a callback."""
+        key = self._cache_key()
+        if not self._active_elem_cache or self._active_elem_cache[0] != key:
+            active = ClassifierCollection(
+                [c for c in self if c.enabled and c.callback and isinstance(c, ElementClassifier)]
+            )
+            self._active_elem_cache = (key, active)
+        return self._active_elem_cache[1]
 
     @property
     def active_view_classifiers(self):
-        return ClassifierCollection([c for c in self if c.enabled and c.callback and isinstance(c, ViewClassifier)])
+        """All enabled view classifiers that have a callback."""
+        key = self._cache_key()
+        if not self._active_view_cache or self._active_view_cache[0] != key:
+            active = ClassifierCollection(
+                [c for c in self if c.enabled and c.callback and isinstance(c, ViewClassifier)]
+            )
+            self._active_view_cache = (key, active)
+        return self._active_view_cache[1]
 
     def __iter__(self):
         yield from self._classifiers.values()
@@ -86,26 +120,72 @@ class ClassifierCollection(Collection):
 class MonkeyPatches:
     """Helper class for monkeypatches"""
 
+    # Number of snapshots for which selector matches are kept, the oldest are forgotten first
+    MAX_CACHED_SNAPSHOTS: int = 8
+
     def __init__(self, patches: Dict[Selector, str] = None):
         self._data: Dict[Selector, str] = patches or {}
         self._default: str = None
+        self._cache: Dict[int, Tuple[PageSnapshot, List[Tuple[Selector, FrozenSet[int], int]]]] = {}
+        self._joined_css: str = ",".join(s.css for s in self._data)
 
     def add(self, selector: Selector, patch: str):
+        """Adds a patch for elements matching the selector. Forgets all cached selector matches."""
         self._data[selector] = patch
+        self._joined_css = ",".join(s.css for s in self._data)
+        self.clear_cache()
 
     def set_default(self, patch: str):
         """Equivalent to ``check(Selector("*"), element)`` but much faster."""
         self._default = patch
 
+    def clear_cache(self):
+        """Forgets all selector matches computed by :func:`check`. Call when snapshots are invalidated."""
+        self._cache.clear()
+
     def check(self, snapshot: PageSnapshot, element: PageElement) -> str:
         """If a rule applies for given element for given snapshot, return the most specific value"""
-        selector_elements = [(s, snapshot.elements.by_selector(s)) for s in self._data]
-        selector_elements.sort(key=lambda item: len(item[1]), reverse=True)
-        for selector, elements in selector_elements:
-            if element in elements:
+        key = id(snapshot)
+        cached = self._cache.get(key)
+        if cached is None or cached[0] is not snapshot:
+            # Keeping the snapshot in the entry keeps its id, and the ids of its metadata dicts, from being reused
+            if cached is None and len(self._cache) >= MonkeyPatches.MAX_CACHED_SNAPSHOTS:
+                del self._cache[next(iter(self._cache))]
+            cached = self._cache[key] = (snapshot, self._match_selectors(snapshot))
+
+        # Elements are identified by their metadata dict, which is shared by copies of the same element
+        element_key = id(element.metadata)
+        for selector, elements, _ in cached[1]:
+            if element_key in elements:
                 return self._data[selector]
         return self._default
 
+    def _match_selectors(self, snapshot: PageSnapshot) -> List[Tuple[Selector, FrozenSet[int], int]]:
+        """
+        Queries the page once with all selectors joined, then assigns each matched tag back to
+        the selectors it matches. Returns the elements per selector sorted by number of matches.
+        """
+        if not self._data or not snapshot.elements:
+            return []
+
+        html = snapshot.page_source.html
+        # soupsieve.match takes :scope to be the matched tag instead of the document, so query those separately
+        scoped = {s: {id(tag) for tag in html.select(s.css)} for s in self._data if ":scope" in s.css}
+
+        by_uid = {e.wtl_uid: e for e in snapshot.elements}
+        buckets: Dict[Selector, List[PageElement]] = {s: [] for s in self._data}
+        for tag in html.select(self._joined_css):
+            if "wtl-uid" not in tag.attrs or int(tag.attrs["wtl-uid"]) not in by_uid:
+                continue
+            element = by_uid[int(tag.attrs["wtl-uid"])]
+            for s, elements in buckets.items():
+                if id(tag) in scoped[s] if s in scoped else soupsieve.match(s.css, tag):
+                    elements.append(element)
+
+        selector_elements = [(s, frozenset(id(e.metadata) for e in es), len(es)) for s, es in buckets.items()]
+        selector_elements.sort(key=lambda item: item[2], reverse=True)
+        return selector_elements
+
     def __contains__(self, selector: Selector):
         return selector in self._data
 
@@ -117,32 +197,47 @@ class FrameSwitcher:
     """
     Helper class for entering and exiting iframes.
     Raises ElementNotFoundError if an iframe could not be found.
+    Found iframes are stored in ``cache`` by xpath, if given, and reused by later instances.
     """
 
-    def __init__(self, xpath: str, js: JavascriptWrapper, driver: webdriver):
+    def __init__(self, xpath: str, js: JavascriptWrapper, driver: webdriver, cache: Dict[str, WebElement] = None):
         self.iframe = None
+        self.xpath = xpath
         self.driver = driver
+        self._cache = cache if cache is not None else {}
 
         if xpath:
-            self.iframe = self.driver.find_element(By.XPATH, xpath)
-            if not self.iframe:
-                raise ElementNotFoundError(f"Found no iframe with xpath '{xpath}'")
+            self.iframe = self._cache.get(xpath) or self._find_iframe()
+
+    def _find_iframe(self) -> WebElement:
+        iframe = self.driver.find_element(By.XPATH, self.xpath)
+        if not iframe:
+            raise ElementNotFoundError(f"Found no iframe with xpath '{self.xpath}'")
+        self._cache[self.xpath] = iframe
+        return iframe
 
     def __enter__(self):
         """
         Goes into an <iframe> object with given iframe.
+        If a cached iframe has gone stale, it is looked up again once.
         """
-        if self.iframe:
-            logger.debug(f"Entering iframe: '{self.iframe}'")
+        if self.iframe is None:
+            return
+        logger.debug("Entering iframe: '%s'", self.iframe)
+        try:
+            self.driver.switch_to.frame(self.iframe)
+        except StaleElementReferenceException:
+            self.iframe = self._find_iframe()
             self.driver.switch_to.frame(self.iframe)
 
     def __exit__(self, *_):
         """
         Steps out into the parent frame.
         """
-        if self.iframe:
-            logger.debug(f"Exiting iframe: '{self.iframe}'")
-            self.driver.switch_to.default_content()
+        if self.iframe is None:
+            return
+        logger.debug("Exiting iframe: '%s'", self.iframe)
+        self.driver.switch_to.default_content()
 
 """
 Even though an iframe is detected as present in the DOM, it may not be visible.
@@ -152,15 +247,9 @@ child element's style is the one that is hiding the iframe.
 """
 def set_iframe_visibility(iframe, driver):
     if not iframe.is_displayed():
-        currEl = iframe
-        parentEl = currEl.find_element(By.XPATH, "..")
-
-        while not parentEl.is_displayed() and parentEl.tag_name != "body":
-            currEl = parentEl
-            parentEl = currEl.find_element(By.XPATH, "..")
-
-        if parentEl.tag_name == "body":
+        # Walk the ancestors in the browser, a webdriver round-trip per ancestor is slow
+        script = JavascriptWrapper.assemble_script((Path("set_iframe_visibility.js"),))
+        found = driver.execute_script(script, iframe)
+        if not found:
             raise Exception("Could not find a visible parent element for the iframe!")
-        else:
-            driver.execute_script("arguments[0].setAttribute('style', 'visibility: visible; display: block');", currEl)
 
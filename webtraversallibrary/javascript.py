@@ -31,6 +31,7 @@ from typing import Any, Dict, Iterable, List, Union
 from selenium.common.exceptions import (
     JavascriptException,
     NoAlertPresentException,
+    TimeoutException,
     UnexpectedAlertPresentException,
     WebDriverException,
 )
@@ -203,6 +204,30 @@ class JavascriptWrapper:
 
         return self.execute_file(Path("element_exists.js"), selector.css)
 
+    def wait_for_element(self, selector: Selector, interval: float = 1.0, timeout: float = None) -> bool:
+        """
+        Waits in the browser until an element exists, watching DOM mutations and polling every ``interval`` seconds.
+        Returns True once the element exists, or False if it did not appear within ``timeout`` seconds.
+        By default the timeout is kept below the script timeout of the driver, if the driver exposes it.
+        """
+        if timeout is None:
+            timeout = self._default_wait_timeout()
+        try:
+            return self.execute_file(
+                Path("wait_for_element.js"), selector.css, int(interval * 1000), int(timeout * 1000), execute_async=True
+            )
+        except TimeoutException:
+            # The driver gave up before the script did, treat it as the element not appearing in time
+            return False
+
+    def _default_wait_timeout(self) -> float:
+        """Returns a wait timeout shorter than the script timeout of the driver, or 20 seconds if it is unknown."""
+        # Only Selenium 4 can read back the configured timeouts
+        script_timeout = getattr(getattr(self.driver, "timeouts", None), "script", None)
+        if not script_timeout:
+            return 20.0
+        return script_timeout * 0.8
+
     def disable_animations(self):
         """
         Turns off animation on the page. Works for jQuery by setting a certain flag and for CSS animations by injecting
@@ -299,6 +324,14 @@ class JavascriptWrapper:
         """
         self.execute_file([Path("dom.js"), Path("fill_text.js")], selector.css, value)
 
+    def batch_dom_ops(self, ops: List[Dict[str, Any]]):
+        """
+        Performs several clicks and text fills in order, in a single script call.
+        Each operation is either ``{"type": "click", "css": ..., "wtlUid": ...}``, behaving like :func:`click_element`,
+        or ``{"type": "fill", "css": ..., "text": ...}``, behaving like :func:`fill_text`.
+        """
+        self.execute_file([Path("dom.js"), Path("batch_dom_ops.js")], ops)
+
     def select(self, selector: Selector, value: str):
         """
         Select an element of a dropdown (select) element.
@@ -306,6 +339,14 @@ class JavascriptWrapper:
         """
         self.execute_file([Path("dom.js"), Path("select.js")], selector.css, value)
 
+    def select_framework_option(self, option_tag: str, value: str) -> str:
+        """
+        Clicks the rendered option element (by tag name) with the shortest text containing the given value,
+        unless it is already selected. Matching is case insensitive and done in a single script call.
+        :return: 'selected', 'already_selected', or 'not_found'
+        """
+        return self.execute_file([Path("dom.js"), Path("select_framework_option.js")], option_tag, value)
+
     @classmethod
     @functools.lru_cache(maxsize=32)
     def assemble_script(cls, filenames: Iterable[Path]) -> str:
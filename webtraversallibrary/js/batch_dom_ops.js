@@ -0,0 +1,42 @@
+// Licensed to the Apache Software Foundation (ASF) under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  The ASF licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//   http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing,
+// software distributed under the License is distributed on an
+// "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+// KIND, either express or implied.  See the License for the
+// specific language governing permissions and limitations
+// under the License.
+
+// Requires dom.js
+
+// Performs a list of DOM operations in order, each one of
+// {type: 'click', css: ..., wtlUid: ...} or {type: 'fill', css: ..., text: ...}
+
+const ops = arguments[0];
+
+for (const op of ops) {
+    let element = document.querySelector(op.css);
+
+    // Same as click_element.js, sometimes the element is only found by its wtl-uid
+    if (element === null && op.wtlUid !== undefined && op.wtlUid !== null) {
+        element = findElementByWtlUid(op.wtlUid);
+    }
+
+    if (element === null) {
+        console.error('batch_dom_ops: Element not found with selector: ', op.css);
+    } else if (op.type === 'click') {
+        clickElement(element);
+    } else if (op.type === 'fill') {
+        userEvent.type(element, op.text);
+    } else {
+        console.error('batch_dom_ops: Unknown operation: ', op.type);
+    }
+}
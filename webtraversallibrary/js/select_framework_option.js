@@ -0,0 +1,49 @@
+// Licensed to the Apache Software Foundation (ASF) under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  The ASF licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//   http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing,
+// software distributed under the License is distributed on an
+// "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+// KIND, either express or implied.  See the License for the
+// specific language governing permissions and limitations
+// under the License.
+
+// Requires dom.js
+
+// Finds the rendered option (by tag name) with the shortest text containing the given value,
+// and clicks it unless it is already selected. Options that are not rendered, e.g. in other
+// closed dropdowns, are skipped.
+// Returns 'selected', 'already_selected', or 'not_found'.
+
+const [optionTag, value] = arguments;
+const needle = value.toLowerCase();
+
+let target = null;
+for (const option of document.getElementsByTagName(optionTag)) {
+    if (option.getClientRects().length === 0) {
+        continue;
+    }
+    const text = option.innerText;
+    if (text.toLowerCase().includes(needle) && (target === null || text.length < target.text.length)) {
+        target = {element: option, text: text};
+    }
+}
+
+if (target === null) {
+    return 'not_found';
+}
+
+// TODO: aria-selected may not always be the attribute that is used
+if (target.element.getAttribute('aria-selected') === 'true') {
+    return 'already_selected';
+}
+
+clickElement(target.element);
+return 'selected';
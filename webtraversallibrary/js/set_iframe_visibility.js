@@ -0,0 +1,35 @@
+// Licensed to the Apache Software Foundation (ASF) under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  The ASF licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//   http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing,
+// software distributed under the License is distributed on an
+// "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+// KIND, either express or implied.  See the License for the
+// specific language governing permissions and limitations
+// under the License.
+
+// Finds the first displayed ancestor of the given (hidden) iframe and makes its child on the path
+// to the iframe visible. Returns false if there is no such ancestor below <body>.
+
+const isDisplayed = e => {
+    const style = getComputedStyle(e);
+    return style.display !== 'none' && style.visibility !== 'hidden' && e.getClientRects().length > 0;
+};
+let currEl = arguments[0];
+let parentEl = currEl.parentElement;
+while (parentEl && !isDisplayed(parentEl) && parentEl.tagName.toLowerCase() !== 'body') {
+    currEl = parentEl;
+    parentEl = currEl.parentElement;
+}
+if (!parentEl || parentEl.tagName.toLowerCase() === 'body') {
+    return false;
+}
+currEl.setAttribute('style', 'visibility: visible; display: block');
+return true;
@@ -0,0 +1,51 @@
+// Licensed to the Apache Software Foundation (ASF) under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  The ASF licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//   http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing,
+// software distributed under the License is distributed on an
+// "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+// KIND, either express or implied.  See the License for the
+// specific language governing permissions and limitations
+// under the License.
+
+// Asynchronous, resolves with true as soon as an element matching the selector exists.
+// The DOM is watched with a MutationObserver and also polled every `interval` ms.
+// Resolves with false if nothing was found within `timeout` ms.
+
+const [selector, interval, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+
+let finished = false;
+let observer = null;
+let poll = null;
+let expiry = null;
+
+const finish = result => {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearInterval(poll);
+    clearTimeout(expiry);
+    done(result);
+};
+
+const check = () => {
+    if (document.querySelector(selector) !== null) {
+        finish(true);
+    }
+};
+
+observer = new MutationObserver(check);
+observer.observe(document, {childList: true, subtree: true});
+poll = setInterval(check, interval);
+expiry = setTimeout(() => finish(false), timeout);
+check();
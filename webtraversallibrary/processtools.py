@@ -24,14 +24,21 @@ import os
 import signal
 from threading import Thread
 from time import sleep
+from typing import TYPE_CHECKING, Iterable, TypeVar
 
 from webtraversallibrary.driver_check import OS, get_current_os
 
+if TYPE_CHECKING:
+    # typing.SupportsIndex requires Python 3.8
+    from typing_extensions import SupportsIndex
+
 logger = logging.getLogger("wtl")
 
 
 _ON_WINDOWS = get_current_os() == OS.WINDOWS
 
+_InvalidatingListT = TypeVar("_InvalidatingListT", bound="InvalidatingList")
+
 
 class cached_property:
     """
@@ -55,6 +62,67 @@ class cached_property:
         return result
 
 
+class InvalidatingList(list):
+    """
+    List calling ``_invalidate`` whenever it is mutated in place.
+    Subclasses caching values computed from their contents should override ``_invalidate``.
+    Instances have no ``__dict__``, subclasses should declare their own ``__slots__``.
+    """
+
+    __slots__ = ()
+
+    def _invalidate(self):
+        pass
+
+    def __setitem__(self, *args):
+        self._invalidate()
+        super().__setitem__(*args)
+
+    def __delitem__(self, *args):
+        self._invalidate()
+        super().__delitem__(*args)
+
+    def __iadd__(self: _InvalidatingListT, other: Iterable) -> _InvalidatingListT:
+        self._invalidate()
+        return super().__iadd__(other)
+
+    def __imul__(self: _InvalidatingListT, n: "SupportsIndex") -> _InvalidatingListT:
+        self._invalidate()
+        return super().__imul__(n)
+
+    def append(self, *args):
+        self._invalidate()
+        super().append(*args)
+
+    def extend(self, *args):
+        self._invalidate()
+        super().extend(*args)
+
+    def insert(self, *args):
+        self._invalidate()
+        super().insert(*args)
+
+    def pop(self, *args):
+        self._invalidate()
+        return super().pop(*args)
+
+    def remove(self, *args):
+        self._invalidate()
+        super().remove(*args)
+
+    def clear(self):
+        self._invalidate()
+        super().clear()
+
+    def reverse(self):
+        self._invalidate()
+        super().reverse()
+
+    def sort(self, *args, **kwargs):
+        self._invalidate()
+        super().sort(*args, **kwargs)
+
+
 class Alarm(Thread):
     """Helper class to run a timeout thread on Windows"""
 
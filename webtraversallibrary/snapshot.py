@@ -26,7 +26,7 @@ import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 import bs4
 from PIL import Image
@@ -35,12 +35,15 @@ from .config import Config
 from .error import ScrapingError
 from .geometry import Point, Rectangle
 from .graphics import crop_image
-from .processtools import cached_property
+from .processtools import InvalidatingList, cached_property
 from .screenshot import Screenshot
 from .selector import Selector
 
 logger = logging.getLogger("wtl")
 
+# Called without arguments whenever a new PageSnapshot is created, e.g. to invalidate caches
+snapshot_callbacks: List[Callable[[], None]] = []
+
 
 @dataclass(frozen=True)
 class PageElement:
@@ -143,9 +146,19 @@ class PageElement:
         return float(value[:-2])
 
 
-class Elements(list):
+class Elements(InvalidatingList):
     """Helper class for a list of elements from the same page"""
 
+    # Results of by_selector per CSS selector, reset when the list is mutated
+    __slots__ = ("_selector_cache",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._selector_cache: Dict[str, Elements] = None
+
+    def _invalidate(self):
+        self._selector_cache = None
+
     def by_score(self, name: Union[str, Iterable[str]], limit: float = 0.0) -> Elements:
         """Return elements tagged with all given scores over a certain limit"""
         if name == "all":
@@ -168,19 +181,28 @@ class Elements(list):
 
     def by_selector(self, selector: Selector) -> Elements:
         """Return all elements that match a given selector"""
+        cache = getattr(self, "_selector_cache", None)
+        if cache is None:
+            cache = self._selector_cache = {}
+        if selector.css not in cache:
+            cache[selector.css] = self._by_selector(selector)
+        return Elements(cache[selector.css])
+
+    def _by_selector(self, selector: Selector) -> Elements:
         if not self:
             return Elements([])
 
-        tags = set(self[0].page.page_source.html.select(selector.css))
+        tags = self[0].page.page_source.html.select(selector.css)
         if not tags:
             return Elements([])
 
-        wtl_uids = set(int(x.attrs["wtl-uid"]) for x in tags if "wtl-uid" in x.attrs)
+        wtl_uids = {int(x.attrs["wtl-uid"]) for x in tags if "wtl-uid" in x.attrs}
         elements = Elements([e for e in self if e.wtl_uid in wtl_uids])
 
         # Falls back on BS4 tags if selector matches something that hasn't been snapshotted yet
         if not elements:
-            elements = Elements([e for e in self if e.tag in tags])
+            tag_set = set(tags)
+            elements = Elements([e for e in self if e.tag in tag_set])
 
         return elements
 
@@ -245,6 +267,9 @@ class PageSnapshot:
         if "screenshots" not in self.page_metadata:
             self.page_metadata["screenshots"] = []
 
+        for cb in snapshot_callbacks:
+            cb()
+
     def new_screenshot(self, name: str, of: str) -> Screenshot:
         """
         Creates a new screenshot from a copy of a previous one.
@@ -27,9 +27,10 @@ import os
 from dataclasses import replace
 from pathlib import Path
 from time import sleep
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, ContextManager, Dict, List, Union
 
 from selenium import webdriver
+from selenium.webdriver.remote.webelement import WebElement
 
 from .actions import Abort, Action, Actions, ElementAction, Navigate, Refresh, Revert, Wait
 from .classifiers import Classifier
@@ -50,6 +51,9 @@ from .window import Window
 
 logger = logging.getLogger("wtl")
 
+# Reusable context manager for actions outside of any iframe
+_NO_FRAME = contextlib.nullcontext()
+
 
 class Workflow:
     """
@@ -103,6 +107,7 @@ class Workflow:
         self.monkeypatches = MonkeyPatches(patches)
         self.classifiers = ClassifierCollection(classifiers)
         self.previous_policy_result = None
+        self._iframe_cache: Dict[str, Dict[str, WebElement]] = {}
 
         # Basic error handling
         assert self.policy, "Workflow created without a policy!"
@@ -256,6 +261,7 @@ class Workflow:
 
         # Scrape the page
         snapshot = self.current_window.scraper.scrape_current_page(iframe_xpath)
+        self.monkeypatches.clear_cache()
 
         # Assemble basic list of actions
         action_list: List[Action] = [Abort(), Refresh(), Navigate(), Wait()]
@@ -464,12 +470,18 @@ class Workflow:
         for window in self.windows:
             window.quit()
 
-    def frame(self, xpath: str) -> FrameSwitcher:
+    def frame(self, xpath: str) -> ContextManager:
         """
         Returns a context manager for entering and exiting iframes.
-        See `FrameSwitcher` for more details.
+        See `FrameSwitcher` for more details. Does nothing if no xpath is given.
         """
-        return FrameSwitcher(xpath, self.js, self.driver)
+        if not xpath:
+            return _NO_FRAME
+        return FrameSwitcher(xpath, self.js, self.driver, cache=self._iframe_cache.setdefault(self.current_tab, {}))
+
+    def clear_iframe_cache(self):
+        """Forgets all iframes found by :func:`frame` in the current tab. Call when the page changes."""
+        self._iframe_cache.pop(self.current_tab, None)
 
     def _perform_action(self, action: Action):
         if not action:
@@ -606,6 +618,7 @@ class Workflow:
 
         self.loop_idx = -1
         self.previous_policy_result = None
+        self._iframe_cache.clear()
 
         # Clear any existing windows
         for window in self.windows: